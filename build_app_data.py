@@ -15,6 +15,11 @@ def parse_args():
     parser.add_argument("--audit-json", help="Optional path for a detailed JSON audit report.")
     parser.add_argument("--eda-csv", help="Optional path for an analysis-ready CSV export.")
     parser.add_argument("--fail-on-audit", action="store_true", help="Fail when the audit still has blocking data gaps.")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Worker processes for parsing input files (defaults to 1, which disables multiprocessing).",
+    )
     return parser.parse_args()
 
 
@@ -27,6 +32,7 @@ def main():
         audit_json_path=Path(args.audit_json) if args.audit_json else None,
         eda_csv_path=Path(args.eda_csv) if args.eda_csv else None,
         fail_on_audit=args.fail_on_audit,
+        workers=args.workers,
     )
     print(
         f"[OK] Wrote {len(summary)} summaries and {len(detail)} details to {args.out_dir} "
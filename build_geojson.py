@@ -4,7 +4,7 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
-from scripts.pipeline.geojson import build_geojson_artifacts
+from scripts.pipeline.geojson import CENTROIDS_FORMAT_CHOICES, COMPRESSION_CHOICES, build_geojson_artifacts
 
 
 def parse_args():
@@ -26,7 +26,29 @@ def parse_args():
         default=4,
         help="Coordinate precision for the centroid index.",
     )
+    parser.add_argument(
+        "--centroids-format",
+        choices=CENTROIDS_FORMAT_CHOICES,
+        default="json",
+        help="Centroid index encoding (binary writes little-endian float32 lng/lat pairs plus a JSON offset index).",
+    )
     parser.add_argument("--timezone", default="Asia/Tokyo", help="Timezone used for hours normalization.")
+    parser.add_argument(
+        "--compression",
+        choices=COMPRESSION_CHOICES,
+        default="none",
+        help="Compress per-category files and the centroid index (gzip writes .gz files referenced by the manifest).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Worker processes for parsing input files (defaults to 1, which disables multiprocessing).",
+    )
+    parser.add_argument(
+        "--ndjson-out",
+        action="store_true",
+        help="Write per-category features as newline-delimited GeoJSON (.geojsonl) instead of FeatureCollections.",
+    )
     return parser.parse_args()
 
 
@@ -39,6 +61,10 @@ def main():
         centroid_max=args.centroid_max,
         coord_decimals=args.coord_decimals,
         timezone=args.timezone,
+        ndjson=args.ndjson_out,
+        workers=args.workers,
+        compression=args.compression,
+        centroids_format=args.centroids_format,
     )
     print(
         f"[OK] Wrote {result['categoryCount']} category GeoJSON files and "
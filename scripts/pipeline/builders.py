@@ -5,8 +5,10 @@ import json
 import math
 import re
 import unicodedata
-from collections import Counter, OrderedDict
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from statistics import mean, pstdev
 from zoneinfo import ZoneInfo
@@ -14,9 +16,10 @@ from zoneinfo import ZoneInfo
 from .constants import CLOSURE_KEYWORDS, POPULAR_HUBS, normalize_category_label
 from .google import missing_google_fields
 from .hours import ALL_DAY_RE, build_hours_payload
-from .records import iter_record_files, read_json_records
+from .records import iter_json_records, iter_record_files, write_json_file
 
 PRICE_NUM_RE = re.compile(r"\d+")
+SLUG_RE = re.compile(r"[^A-Za-z0-9]+")
 
 
 def safe_float(value):
@@ -33,14 +36,19 @@ def safe_int(value):
         return 0
 
 
+@lru_cache(maxsize=1024)
 def slugify(text: str):
     if not text:
         return "unknown"
-    normalized = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
-    collapsed = re.sub(r"[^A-Za-z0-9]+", "-", normalized).strip("-").lower()
+    if text.isascii():
+        normalized = text
+    else:
+        normalized = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    collapsed = SLUG_RE.sub("-", normalized).strip("-").lower()
     return collapsed or "unknown"
 
 
+@lru_cache(maxsize=1024)
 def price_range(raw_value: str | None):
     if not raw_value or raw_value.strip() == "-":
         return (None, None)
@@ -54,6 +62,7 @@ def price_range(raw_value: str | None):
     return (numbers[0], numbers[0])
 
 
+@lru_cache(maxsize=1024)
 def price_bucket(raw_value: str | None):
     low, high = price_range(raw_value)
     if low is None and high is None:
@@ -72,6 +81,7 @@ def price_bucket(raw_value: str | None):
     return 5
 
 
+@lru_cache(maxsize=1024)
 def price_tier(raw_value: str | None):
     low, high = price_range(raw_value)
     if low is None and high is None:
@@ -225,7 +235,12 @@ def _badges_for_entry(entry):
     return list(dict.fromkeys([badge for badge in badges if badge]))
 
 
-def base_entry(record, freshness_updated_at: str, seen_ids: dict[str, int], *, now: datetime):
+def unique_identifier(base_identifier: str, seen_ids: dict[str, int]):
+    seen_ids[base_identifier] = seen_ids.get(base_identifier, 0) + 1
+    return base_identifier if seen_ids[base_identifier] == 1 else f"{base_identifier}::{seen_ids[base_identifier]}"
+
+
+def base_entry(record, freshness_updated_at: str, *, now: datetime):
     lat = safe_float(record.get("lat"))
     lng = safe_float(record.get("lng"))
     if lat is None or lng is None:
@@ -239,9 +254,7 @@ def base_entry(record, freshness_updated_at: str, seen_ids: dict[str, int], *, n
     }
     tabelog_reviews = safe_int(record.get("review_count_tabelog"))
     google_reviews = safe_int(record.get("google_reviews") or record.get("g_reviews"))
-    base_identifier = str(record.get("place_id") or record.get("url") or f"{lat:.5f}-{lng:.5f}")
-    seen_ids[base_identifier] = seen_ids.get(base_identifier, 0) + 1
-    identifier = base_identifier if seen_ids[base_identifier] == 1 else f"{base_identifier}::{seen_ids[base_identifier]}"
+    identifier = str(record.get("place_id") or record.get("url") or f"{lat:.5f}-{lng:.5f}")
     price = price_band(record)
     station = station_from_area(record.get("area"))
     google_score = safe_float(record.get("google_rating") or record.get("g_rating"))
@@ -349,7 +362,7 @@ def compute_consensus(entries):
 
 def build_outputs(entries):
     summary = []
-    detail = OrderedDict()
+    detail = {}
     detail_keys = {
         "address",
         "priceLunch",
@@ -448,7 +461,35 @@ def export_eda_csv(entries, output_path: Path):
             writer.writerows(rows)
 
 
-def build_audit_report(records: list[dict], entries: list[dict]):
+def _audit_record_facts(record: dict, *, now: datetime):
+    # Only what the audit summary needs, so raw records can be dropped as soon as they are read.
+    hours_payload = build_hours_payload(record.get("hours_raw"), record.get("hours_notes_structured"), now=now)
+    covered_days = sum(1 for windows in hours_payload["weeklyTimeline"].values() if windows)
+    raw_hours_blob = json.dumps(record.get("hours_raw") or [], ensure_ascii=False)
+    google_missing = missing_google_fields(record)
+    missing_coordinates_category = None
+    if safe_float(record.get("lat")) is None or safe_float(record.get("lng")) is None:
+        missing_coordinates_category = normalize_category_label(record.get("category_en"), record.get("category_jp"))
+
+    return {
+        "label": record.get("url") or record.get("name"),
+        "missingHoursRaw": not record.get("hours_raw"),
+        "zeroWeekdayCoverage": covered_days == 0 and bool(hours_payload["advisories"]),
+        "allDayParseFailure": bool(ALL_DAY_RE.search(raw_hours_blob))
+        and not any(
+            window.get("allDay")
+            for windows in hours_payload["weeklyTimeline"].values()
+            for window in windows
+        ),
+        "missingGoogleFields": [key for key, is_missing in google_missing.items() if is_missing],
+        "googleCoreMissing": google_core_missing(record),
+        "missingBusinessStatus": google_missing["business_status"],
+        "closureState": derive_closure(record, hours_payload)["state"],
+        "missingCoordinatesCategory": missing_coordinates_category,
+    }
+
+
+def _summarize_audit(record_facts: list[dict], app_ready_count: int):
     category_missing_coords = Counter()
     zero_weekday_coverage = []
     unresolved_google_core = []
@@ -457,41 +498,24 @@ def build_audit_report(records: list[dict], entries: list[dict]):
     closure_counts = Counter()
     missing_google_field_counts = Counter()
 
-    for record in records:
-        hours_payload = build_hours_payload(record.get("hours_raw"), record.get("hours_notes_structured"))
-        covered_days = sum(1 for windows in hours_payload["weeklyTimeline"].values() if windows)
-        if covered_days == 0 and hours_payload["advisories"]:
-            zero_weekday_coverage.append(record.get("url") or record.get("name"))
-
-        raw_hours_blob = json.dumps(record.get("hours_raw") or [], ensure_ascii=False)
-        if ALL_DAY_RE.search(raw_hours_blob) and not any(
-            window.get("allDay")
-            for windows in hours_payload["weeklyTimeline"].values()
-            for window in windows
-        ):
-            all_day_failures.append(record.get("url") or record.get("name"))
-
-        google_missing = missing_google_fields(record)
-        for key, is_missing in google_missing.items():
-            if is_missing:
-                missing_google_field_counts[key] += 1
-
-        if google_core_missing(record):
-            unresolved_google_core.append(record.get("url") or record.get("name"))
-        if google_missing["business_status"]:
-            missing_business_status.append(record.get("url") or record.get("name"))
-
-        closure = derive_closure(record, hours_payload)
-        closure_counts[closure["state"]] += 1
-
-        if safe_float(record.get("lat")) is None or safe_float(record.get("lng")) is None:
-            category = normalize_category_label(record.get("category_en"), record.get("category_jp"))
-            category_missing_coords[category] += 1
+    for facts in record_facts:
+        if facts["zeroWeekdayCoverage"]:
+            zero_weekday_coverage.append(facts["label"])
+        if facts["allDayParseFailure"]:
+            all_day_failures.append(facts["label"])
+        missing_google_field_counts.update(facts["missingGoogleFields"])
+        if facts["googleCoreMissing"]:
+            unresolved_google_core.append(facts["label"])
+        if facts["missingBusinessStatus"]:
+            missing_business_status.append(facts["label"])
+        closure_counts[facts["closureState"]] += 1
+        if facts["missingCoordinatesCategory"] is not None:
+            category_missing_coords[facts["missingCoordinatesCategory"]] += 1
 
     return {
-        "rawRecordCount": len(records),
-        "appReadyRecordCount": len(entries),
-        "missingHoursRawCount": sum(1 for record in records if not record.get("hours_raw")),
+        "rawRecordCount": len(record_facts),
+        "appReadyRecordCount": app_ready_count,
+        "missingHoursRawCount": sum(1 for facts in record_facts if facts["missingHoursRaw"]),
         "zeroWeekdayCoverageCount": len(zero_weekday_coverage),
         "zeroWeekdayCoverageExamples": zero_weekday_coverage[:20],
         "allDayParseFailureCount": len(all_day_failures),
@@ -506,23 +530,54 @@ def build_audit_report(records: list[dict], entries: list[dict]):
     }
 
 
-def collect_entries(*, input_root: Path, timezone: str = "Asia/Tokyo"):
-    tz = ZoneInfo(timezone)
-    freshness = datetime.now(tz).replace(microsecond=0).isoformat()
-    now = datetime.now(tz)
+def build_audit_report(records: list[dict], entries: list[dict], *, now: datetime | None = None):
+    current_time = now or datetime.now()
+    return _summarize_audit([_audit_record_facts(record, now=current_time) for record in records], len(entries))
+
+
+def _file_entries(task):
+    path, freshness_updated_at, now = task
+    record_facts = []
+    entries = []
+    for record in iter_json_records(path):
+        record_facts.append(_audit_record_facts(record, now=now))
+        if record.get("lat") is None or record.get("lng") is None:
+            continue
+        entry = base_entry(record, freshness_updated_at, now=now)
+        if entry is not None:
+            entries.append(entry)
+    return record_facts, entries
+
+
+def collect_entries(
+    *,
+    input_root: Path,
+    timezone: str = "Asia/Tokyo",
+    workers: int | None = None,
+    now: datetime | None = None,
+):
+    now = now or datetime.now(ZoneInfo(timezone))
+    freshness = now.replace(microsecond=0).isoformat()
     entries = []
-    raw_records = []
+    record_facts = []
     seen_ids: dict[str, int] = {}
 
-    for path in iter_record_files(input_root):
-        for record in read_json_records(path):
-            raw_records.append(record)
-            entry = base_entry(record, freshness, seen_ids, now=now)
-            if entry is not None:
-                entries.append(entry)
+    tasks = [(path, freshness, now) for path in iter_record_files(input_root)]
+    worker_count = min(workers or 1, len(tasks))
+    if worker_count > 1:
+        with ProcessPoolExecutor(max_workers=worker_count) as executor:
+            file_results = list(executor.map(_file_entries, tasks, chunksize=4))
+    else:
+        file_results = [_file_entries(task) for task in tasks]
+
+    for file_facts, file_entries in file_results:
+        record_facts.extend(file_facts)
+        for entry in file_entries:
+            entry["id"] = unique_identifier(entry["id"], seen_ids)
+            entries.append(entry)
 
     compute_consensus(entries)
-    return freshness, raw_records, entries
+    return freshness, record_facts, entries
 
 
 def build_app_data(
@@ -533,39 +588,34 @@ def build_app_data(
     audit_json_path: Path | None = None,
     eda_csv_path: Path | None = None,
     fail_on_audit: bool = False,
+    workers: int | None = None,
 ):
     output_root.mkdir(parents=True, exist_ok=True)
-    freshness, raw_records, entries = collect_entries(input_root=input_root, timezone=timezone)
+    now = datetime.now(ZoneInfo(timezone))
+    freshness, record_facts, entries = collect_entries(input_root=input_root, timezone=timezone, workers=workers, now=now)
     summary, detail = build_outputs(entries)
-    audit = build_audit_report(raw_records, entries)
+    audit = _summarize_audit(record_facts, len(entries))
 
-    (output_root / "places-summary.min.json").write_text(
-        json.dumps(summary, ensure_ascii=False, separators=(",", ":")),
-        encoding="utf-8",
-    )
-    (output_root / "places-detail.min.json").write_text(
-        json.dumps(detail, ensure_ascii=False, separators=(",", ":")),
-        encoding="utf-8",
-    )
-    (output_root / "popular-hubs.min.json").write_text(
-        json.dumps(POPULAR_HUBS, ensure_ascii=False, separators=(",", ":")),
-        encoding="utf-8",
-    )
-    (output_root / "build-meta.json").write_text(
-        json.dumps(
+    audit_target = audit_json_path or (output_root / "build-audit.json")
+    artifacts = [
+        (output_root / "places-summary.min.json", summary, False),
+        (output_root / "places-detail.min.json", detail, False),
+        (output_root / "popular-hubs.min.json", POPULAR_HUBS, False),
+        (
+            output_root / "build-meta.json",
             {
                 "generatedAt": freshness,
                 "placeCount": len(summary),
                 "hubCount": len(POPULAR_HUBS),
             },
-            ensure_ascii=False,
-            separators=(",", ":"),
+            False,
         ),
-        encoding="utf-8",
-    )
-
-    audit_target = audit_json_path or (output_root / "build-audit.json")
-    audit_target.write_text(json.dumps(audit, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        (audit_target, audit, True),
+    ]
+    with ThreadPoolExecutor(max_workers=len(artifacts)) as executor:
+        futures = [executor.submit(write_json_file, path, payload, indent=indent) for path, payload, indent in artifacts]
+        for future in futures:
+            future.result()
 
     if eda_csv_path is not None:
         export_eda_csv(entries, eda_csv_path)
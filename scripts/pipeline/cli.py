@@ -118,6 +118,7 @@ def command_build_app_data(args):
         audit_json_path=Path(args.audit_json) if args.audit_json else None,
         eda_csv_path=Path(args.eda_csv) if args.eda_csv else None,
         fail_on_audit=args.fail_on_audit,
+        workers=args.workers,
     )
     _print_json(audit)
 
@@ -386,6 +387,7 @@ def build_parser():
     build_parser_cmd.add_argument("--audit-json")
     build_parser_cmd.add_argument("--eda-csv")
     build_parser_cmd.add_argument("--fail-on-audit", action="store_true")
+    build_parser_cmd.add_argument("--workers", type=int, help="Worker processes for parsing input files (defaults to 1).")
     build_parser_cmd.set_defaults(func=command_build_app_data)
 
     export_parser = subparsers.add_parser("export-eda", help="Write analysis-ready CSV")
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 DAY_ORDER = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+DAY_INDEX = {day: index for index, day in enumerate(DAY_ORDER)}
 DAY_ABBR = {
     "mon": "Mon",
     "tue": "Tue",
@@ -84,6 +87,7 @@ CATEGORY_LABEL_ALIASES = {
 }
 
 
+@lru_cache(maxsize=256)
 def normalize_category_label(name_en: str | None, name_jp: str | None = None, *, fallback: str = "Unknown"):
     for raw_value in (name_en, name_jp):
         label = (raw_value or "").strip()
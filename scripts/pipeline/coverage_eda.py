@@ -3,6 +3,7 @@ from __future__ import annotations
 import argparse
 import json
 import re
+from datetime import datetime
 from pathlib import Path
 
 import pandas as pd
@@ -10,7 +11,7 @@ import pandas as pd
 from .constants import normalize_category_label as normalize_pipeline_category_label
 from .google import missing_google_fields
 from .hours import build_hours_payload
-from .records import iter_record_files, read_json_records
+from .records import iter_json_records, iter_record_files
 
 YEAR_SUFFIX_RE = re.compile(r"_20\d{2}$")
 REGION_SUFFIXES = {"EAST", "WEST", "TOKYO", "ALL"}
@@ -47,11 +48,12 @@ def normalize_category_label(value: str | None, fallback: str):
 
 def raw_records_frame(input_root: Path):
     rows = []
+    now = datetime.now()
     source_files = list(iter_record_files(input_root))
     for path in source_files:
         inferred_category = infer_source_category(path)
-        for record in read_json_records(path):
-            hours_payload = build_hours_payload(record.get("hours_raw"), record.get("hours_notes_structured"))
+        for record in iter_json_records(path):
+            hours_payload = build_hours_payload(record.get("hours_raw"), record.get("hours_notes_structured"), now=now)
             weekly = hours_payload["weeklyTimeline"]
             special = hours_payload["hoursSpecialDays"]
             google_missing = missing_google_fields(record)
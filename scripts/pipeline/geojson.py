@@ -1,32 +1,53 @@
 from __future__ import annotations
 
-import json
+import gzip
 import math
-from collections import OrderedDict, defaultdict
+import sys
+from array import array
+from collections import defaultdict
 from pathlib import Path
 
+import numpy as np
+
 from .builders import collect_entries
+from .records import dump_json_bytes, write_json_file
 
+FEATURE_COLLECTION_HEAD = b'{"type":"FeatureCollection","features":['
+FEATURE_COLLECTION_TAIL = b"]}"
+COMPRESSION_CHOICES = ("none", "gzip")
+CENTROIDS_FORMAT_CHOICES = ("json", "binary")
+GZIP_LEVEL = 6
 
-def quantize_coord(value: float, decimals: int = 4):
-    return float(f"{value:.{decimals}f}")
+
+def artifact_name(name: str, compression: str = "none"):
+    return f"{name}.gz" if compression == "gzip" else name
 
 
-def bbox_update(bbox, lng, lat):
-    minx, miny, maxx, maxy = bbox
-    if lng < minx:
-        minx = lng
-    if lng > maxx:
-        maxx = lng
-    if lat < miny:
-        miny = lat
-    if lat > maxy:
-        maxy = lat
-    return [minx, miny, maxx, maxy]
+def open_artifact(path: Path, compression: str = "none"):
+    if compression == "gzip":
+        return gzip.GzipFile(path, mode="wb", compresslevel=GZIP_LEVEL, mtime=0)
+    return path.open("wb")
+
+
+def centroids_to_binary(centroids: dict[str, list[list[float]]]):
+    points = array("f")
+    index = {}
+    for key, coords in centroids.items():
+        index[key] = {"offset": len(points) // 2, "count": len(coords)}
+        for lng, lat in coords:
+            points.append(lng)
+            points.append(lat)
+    if sys.byteorder == "big":
+        points.byteswap()
+    return points.tobytes(), index
+
+
+def quantize_coord(value: float, decimals: int = 4):
+    return float(f"{value:.{decimals}f}")
 
 
 def entry_to_feature(entry: dict):
-    props = OrderedDict()
+    props = {}
     props["id"] = entry["placeId"] or entry["id"]
     props["name"] = entry["nameEn"] or entry["nameJp"]
     props["name_local"] = entry["nameJp"]
@@ -79,67 +100,91 @@ def build_geojson_artifacts(
     centroid_max: int = 4000,
     coord_decimals: int = 4,
     timezone: str = "Asia/Tokyo",
+    ndjson: bool = False,
+    workers: int | None = None,
+    compression: str = "none",
+    centroids_format: str = "json",
 ):
+    if compression not in COMPRESSION_CHOICES:
+        raise ValueError(f"Unsupported compression: {compression}")
+    if centroids_format not in CENTROIDS_FORMAT_CHOICES:
+        raise ValueError(f"Unsupported centroids format: {centroids_format}")
+
     output_root.mkdir(parents=True, exist_ok=True)
-    _, _, entries = collect_entries(input_root=input_root, timezone=timezone)
-
-    categories = defaultdict(list)
-    bboxes = {}
-    counts = defaultdict(int)
-
-    for entry in entries:
-        feature = entry_to_feature(entry)
-        key = feature.pop("_category_key", "unknown")
-        categories[key].append(feature)
-        counts[key] += 1
-        lng, lat = feature["geometry"]["coordinates"]
-        if key not in bboxes:
-            bboxes[key] = [lng, lat, lng, lat]
-        else:
-            bboxes[key] = bbox_update(bboxes[key], lng, lat)
+    _, _, entries = collect_entries(input_root=input_root, timezone=timezone, workers=workers)
+
+    handles = {}
+    out_names = {}
+    labels = {}
+    coords = defaultdict(list)
+
+    try:
+        for entry in entries:
+            feature = entry_to_feature(entry)
+            key = feature.pop("_category_key", "unknown")
+            handle = handles.get(key)
+            if handle is None:
+                out_name = f"{key}_{version}.geojsonl" if ndjson else f"{key}_{version}.min.geojson"
+                out_names[key] = artifact_name(out_name, compression)
+                handle = handles[key] = open_artifact(output_root / out_names[key], compression)
+                if not ndjson:
+                    handle.write(FEATURE_COLLECTION_HEAD)
+                labels[key] = feature["properties"]["category"]["en"] or key.replace("_", " ").title()
+            elif not ndjson:
+                handle.write(b",")
+            handle.write(dump_json_bytes(feature))
+            if ndjson:
+                handle.write(b"\n")
+
+            coords[key].append(feature["geometry"]["coordinates"])
+
+        if not ndjson:
+            for handle in handles.values():
+                handle.write(FEATURE_COLLECTION_TAIL)
+    finally:
+        for handle in handles.values():
+            handle.close()
 
     manifest_items = []
     centroids = {}
-    for key, features in categories.items():
-        feature_collection = {"type": "FeatureCollection", "features": features}
-        out_name = f"{key}_{version}.min.geojson"
-        out_path = output_root / out_name
-        out_path.write_text(json.dumps(feature_collection, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
-
-        step = max(1, math.ceil(len(features) / max(1, centroid_max)))
-        sampled_features = features[::step] if step > 1 else features
+    for key, points in coords.items():
+        points_array = np.asarray(points, dtype=np.float64)
+        step = max(1, math.ceil(len(points) / max(1, centroid_max)))
         centroids[key] = [
-            [
-                quantize_coord(feature["geometry"]["coordinates"][0], coord_decimals),
-                quantize_coord(feature["geometry"]["coordinates"][1], coord_decimals),
-            ]
-            for feature in sampled_features
+            [quantize_coord(lng, coord_decimals), quantize_coord(lat, coord_decimals)]
+            for lng, lat in points_array[::step].tolist()
         ]
-
-        label_guess = features[0]["properties"]["category"]["en"] or key.replace("_", " ").title()
         manifest_items.append(
             {
                 "key": key,
-                "label": label_guess,
-                "url": f"geojson/{out_name}",
-                "count": counts[key],
-                "bbox": bboxes.get(key),
+                "label": labels[key],
+                "url": f"geojson/{out_names[key]}",
+                "count": len(points),
+                "bbox": [*points_array.min(axis=0).tolist(), *points_array.max(axis=0).tolist()],
             }
         )
 
-    (output_root / "category_centroids.min.json").write_text(
-        json.dumps(centroids, ensure_ascii=False, separators=(",", ":")),
-        encoding="utf-8",
-    )
-    (output_root / "manifest.json").write_text(
-        json.dumps({"categories": sorted(manifest_items, key=lambda item: item["label"].lower())}, ensure_ascii=False, indent=2)
-        + "\n",
-        encoding="utf-8",
+    centroids_index_path = None
+    if centroids_format == "binary":
+        centroids_blob, centroids_index = centroids_to_binary(centroids)
+        centroids_path = output_root / artifact_name("category_centroids.f32.bin", compression)
+        centroids_index_path = output_root / "category_centroids.index.json"
+        write_json_file(centroids_index_path, centroids_index)
+    else:
+        centroids_blob = dump_json_bytes(centroids)
+        centroids_path = output_root / artifact_name("category_centroids.min.json", compression)
+    with open_artifact(centroids_path, compression) as handle:
+        handle.write(centroids_blob)
+    write_json_file(
+        output_root / "manifest.json",
+        {"categories": sorted(manifest_items, key=lambda item: item["label"].lower())},
+        indent=True,
     )
 
     return {
-        "categoryCount": len(categories),
+        "categoryCount": len(handles),
         "featureCount": len(entries),
         "manifestPath": str(output_root / "manifest.json"),
-        "centroidsPath": str(output_root / "category_centroids.min.json"),
+        "centroidsPath": str(centroids_path),
+        "centroidsIndexPath": str(centroids_index_path) if centroids_index_path else None,
     }
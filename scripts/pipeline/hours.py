@@ -1,38 +1,45 @@
 from __future__ import annotations
 
+import hashlib
 import re
 from collections import defaultdict
 from datetime import datetime
+from functools import lru_cache
 
-from .constants import DAY_ABBR, DAY_ALIASES, DAY_ORDER, GENERIC_HOURS_NOTICE, SPECIAL_DAY_ALIASES
+from .constants import DAY_ABBR, DAY_ALIASES, DAY_INDEX, DAY_ORDER, GENERIC_HOURS_NOTICE, SPECIAL_DAY_ALIASES
+from .records import dump_json_bytes
 
 DAY_RANGE_RE = re.compile(r"([A-Za-z]{3,9})\s*[-~]\s*([A-Za-z]{3,9})")
 TIME_RANGE_RE = re.compile(r"(?P<start>\d{1,2}:\d{2})\s*[-~]\s*(?P<end>\d{1,2}:\d{2})")
-LAST_ORDER_RE = re.compile(r"(?i)LO\s*(?:(?P<kind>Food|Foods?|Drink|Drinks?)\s*)?(?P<time>\d{1,2}:\d{2})")
+# The LO time sits in a lookahead so a range starting at that time is still scanned on its own.
+HOURS_TOKEN_RE = re.compile(
+    r"(?P<start>\d{1,2}:\d{2})\s*[-~]\s*(?P<end>\d{1,2}:\d{2})"
+    r"|LO\s*(?:(?P<kind>Food|Foods?|Drink|Drinks?)\s*)?(?=(?P<time>\d{1,2}:\d{2}))",
+    re.IGNORECASE,
+)
 ALL_DAY_RE = re.compile(r"(?i)(open\s*24\s*hours|24\s*hours|24h|24時間(?:営業)?|24時間オープン)")
 WHITESPACE_RE = re.compile(r"\s+")
+LAST_ORDER_MARK_RE = re.compile(r"L\.O\.?|L O")
+DASH_TABLE = str.maketrans(dict.fromkeys("〜～—–", "-"))
+HOURS_PAYLOAD_CACHE_MAX = 65536
 
+# Payloads are shared between records with identical hours input; callers treat them as read-only.
+_hours_payload_cache: dict[tuple, dict] = {}
 
+
+@lru_cache(maxsize=16384)
 def normalize_text(text: str | None):
-    value = text or ""
-    return (
-        value.replace("〜", "-")
-        .replace("～", "-")
-        .replace("—", "-")
-        .replace("–", "-")
-        .replace(" to ", "-")
-        .replace("L.O.", "LO")
-        .replace("L.O", "LO")
-        .replace("L O", "LO")
-        .strip()
-    )
+    value = (text or "").translate(DASH_TABLE).replace(" to ", "-")
+    return LAST_ORDER_MARK_RE.sub("LO", value).strip()
 
 
+@lru_cache(maxsize=4096)
 def normalize_clock(clock: str):
     hours, minutes = [int(part) for part in clock.split(":")]
     return f"{hours:02d}:{minutes:02d}"
 
 
+@lru_cache(maxsize=4096)
 def minutes_value(clock: str, *, end: bool = False):
     hours, minutes = [int(part) for part in clock.split(":")]
     if hours == 24:
@@ -73,30 +80,25 @@ def parse_time_ranges(detail: str | None):
     if ALL_DAY_RE.search(text):
         return [all_day_window()]
 
-    ranges = list(TIME_RANGE_RE.finditer(text))
-    if not ranges:
-        return []
+    ranges: list[tuple[str, str, dict[str, str]]] = []
+    for match in HOURS_TOKEN_RE.finditer(text):
+        if match.group("start") is not None:
+            ranges.append((normalize_clock(match.group("start")), normalize_clock(match.group("end")), {}))
+            continue
+        if not ranges:
+            continue
+        kind = (match.group("kind") or "generic").lower()
+        value = normalize_clock(match.group("time"))
+        last_order_detail = ranges[-1][2]
+        if "drink" in kind:
+            last_order_detail["drinks"] = value
+        elif "food" in kind:
+            last_order_detail["food"] = value
+        else:
+            last_order_detail["generic"] = value
 
-    last_orders = list(LAST_ORDER_RE.finditer(text))
     windows = []
-    for index, match in enumerate(ranges):
-        start = normalize_clock(match.group("start"))
-        end = normalize_clock(match.group("end"))
-        next_range_start = ranges[index + 1].start() if index + 1 < len(ranges) else float("inf")
-        last_order_detail: dict[str, str] = {}
-
-        for lo_match in last_orders:
-            if not (match.start() <= lo_match.start() < next_range_start):
-                continue
-            kind = (lo_match.group("kind") or "generic").lower()
-            value = normalize_clock(lo_match.group("time"))
-            if "drink" in kind:
-                last_order_detail["drinks"] = value
-            elif "food" in kind:
-                last_order_detail["food"] = value
-            else:
-                last_order_detail["generic"] = value
-
+    for start, end, last_order_detail in ranges:
         all_day = start == "00:00" and end == "24:00"
         windows.append(
             {
@@ -133,8 +135,8 @@ def parse_title_days(title: str | None):
             start = DAY_ALIASES.get(match.group(1).lower())
             end = DAY_ALIASES.get(match.group(2).lower())
             if start is not None and end is not None:
-                start_index = DAY_ORDER.index(start)
-                end_index = DAY_ORDER.index(end)
+                start_index = DAY_INDEX[start]
+                end_index = DAY_INDEX[end]
                 if start_index <= end_index:
                     weekday_days.extend(DAY_ORDER[start_index : end_index + 1])
                 else:
@@ -154,15 +156,13 @@ def is_explicit_closed(detail: str | None):
     return text == "closed" or ("closed" in text and not TIME_RANGE_RE.search(text))
 
 
-def _group_days(days: list[str]):
+def _day_groups_label(days: list[str]):
     if not days:
         return ""
-    ordered = sorted(set(days), key=lambda day: DAY_ORDER.index(day))
     groups: list[list[str]] = []
-    current = [ordered[0]]
-    for day in ordered[1:]:
-        expected = DAY_ORDER.index(current[-1]) + 1
-        if DAY_ORDER.index(day) == expected:
+    current = [days[0]]
+    for day in days[1:]:
+        if DAY_INDEX[day] == DAY_INDEX[current[-1]] + 1:
             current.append(day)
         else:
             groups.append(current)
@@ -177,6 +177,19 @@ def _group_days(days: list[str]):
     return ", ".join(parts)
 
 
+GROUP_DAYS_LABELS = [
+    _day_groups_label([day for index, day in enumerate(DAY_ORDER) if mask & (1 << index)])
+    for mask in range(1 << len(DAY_ORDER))
+]
+
+
+def _group_days(days: list[str]):
+    mask = 0
+    for day in days:
+        mask |= 1 << DAY_INDEX[day]
+    return GROUP_DAYS_LABELS[mask]
+
+
 def window_label(window: dict):
     if window.get("allDay"):
         return "Open 24 hours"
@@ -249,64 +262,58 @@ def week_compact_pretty(weekly: dict[str, list[dict]]):
     return "; ".join(parts)
 
 
-def _open_window_status(window: dict, current_minute: int):
+def _open_window_status(window: dict, current_minute: int, start: int):
     if window.get("allDay"):
-        return {"isOpen": True, "minutesUntilClose": None}
+        return True, None
 
-    start = minutes_value(window["open"])
     end = minutes_value(window["close"], end=True)
-    crosses = window.get("crossesMidnight", False)
-    if not crosses:
+    if not window.get("crossesMidnight", False):
         if start <= current_minute < end:
-            return {"isOpen": True, "minutesUntilClose": end - current_minute}
-        return {"isOpen": False, "minutesUntilClose": None}
+            return True, end - current_minute
+        return False, None
 
     if current_minute >= start:
-        return {"isOpen": True, "minutesUntilClose": (24 * 60) - current_minute + end}
+        return True, (24 * 60) - current_minute + end
     if current_minute < end:
-        return {"isOpen": True, "minutesUntilClose": end - current_minute}
-    return {"isOpen": False, "minutesUntilClose": None}
+        return True, end - current_minute
+    return False, None
 
 
 def summarize_for_today(weekly: dict[str, list[dict]], local_now: datetime):
     day_key = DAY_ORDER[local_now.weekday()]
     current_minute = (local_now.hour * 60) + local_now.minute
-    todays_windows = list(weekly.get(day_key) or [])
-
+    todays_windows = weekly.get(day_key) or []
     previous_day_key = DAY_ORDER[(local_now.weekday() - 1) % len(DAY_ORDER)]
-    for previous in weekly.get(previous_day_key) or []:
-        if previous.get("crossesMidnight") and not previous.get("allDay"):
-            carried = dict(previous)
-            carried["carriedFromPrevious"] = True
-            todays_windows.append(carried)
-
-    for window in todays_windows:
-        state = _open_window_status(window, current_minute)
-        if not state["isOpen"]:
-            continue
-        last_order = window.get("lastOrder")
-        return compact_today(weekly.get(day_key) or []), {
-            "status": "open",
-            "segment": {
-                "start": window["open"],
-                "end": window["close"],
-                "allDay": bool(window.get("allDay")),
-                "last_order": last_order,
-                "last_order_detail": window.get("lastOrderDetail"),
-            },
-            "closes_in_min": state["minutesUntilClose"],
-            "lo_in_min": None if not last_order else max(minutes_value(last_order, end=True) - current_minute, 0),
-            "crosses_midnight": bool(window.get("crossesMidnight")),
-        }
-
-    future_windows = sorted(
-        [window for window in weekly.get(day_key) or [] if minutes_value(window["open"]) > current_minute],
-        key=lambda window: minutes_value(window["open"]),
-    )
+    carried_windows = [
+        previous
+        for previous in weekly.get(previous_day_key) or []
+        if previous.get("crossesMidnight") and not previous.get("allDay")
+    ]
+
     opens_in = None
-    if future_windows:
-        opens_in = minutes_value(future_windows[0]["open"]) - current_minute
-    return compact_today(weekly.get(day_key) or []), {"status": "closed", "opens_in_min": opens_in}
+    for index, window in enumerate([*todays_windows, *carried_windows]):
+        start = minutes_value(window["open"])
+        is_open, minutes_until_close = _open_window_status(window, current_minute, start)
+        if is_open:
+            last_order = window.get("lastOrder")
+            return compact_today(todays_windows), {
+                "status": "open",
+                "segment": {
+                    "start": window["open"],
+                    "end": window["close"],
+                    "allDay": bool(window.get("allDay")),
+                    "last_order": last_order,
+                    "last_order_detail": window.get("lastOrderDetail"),
+                },
+                "closes_in_min": minutes_until_close,
+                "lo_in_min": None if not last_order else max(minutes_value(last_order, end=True) - current_minute, 0),
+                "crosses_midnight": bool(window.get("crossesMidnight")),
+            }
+        if index < len(todays_windows) and start > current_minute:
+            until_open = start - current_minute
+            opens_in = until_open if opens_in is None else min(opens_in, until_open)
+
+    return compact_today(todays_windows), {"status": "closed", "opens_in_min": opens_in}
 
 
 def hours_confidence(weekly: dict[str, list[dict]], advisories: list[str], policies: list[str]):
@@ -338,7 +345,7 @@ def _structured_business_hours(notes_structured: dict | None):
     return policies
 
 
-def build_hours_payload(hours_raw: list[dict] | None, notes_structured: dict | None = None, *, now: datetime | None = None):
+def _compute_hours_payload(hours_raw: list[dict] | None, notes_structured: dict | None, current_time: datetime):
     weekly = {day: [] for day in DAY_ORDER}
     special_days = {key: [] for key in SPECIAL_DAY_ALIASES.values()}
     weekly_closed: set[str] = set()
@@ -391,7 +398,6 @@ def build_hours_payload(hours_raw: list[dict] | None, notes_structured: dict | N
     policies = list(dict.fromkeys([policy for policy in policies if policy and policy != GENERIC_HOURS_NOTICE]))
     advisories = list(dict.fromkeys([advisory for advisory in advisories if advisory != GENERIC_HOURS_NOTICE]))
 
-    current_time = now or datetime.now()
     today_display, open_now = summarize_for_today(weekly, current_time)
     return {
         "weeklyTimeline": weekly,
@@ -406,3 +412,30 @@ def build_hours_payload(hours_raw: list[dict] | None, notes_structured: dict | N
         "openNowMeta": open_now,
         "closedOn": closed_on,
     }
+
+
+def _copy_hours_payload(payload: dict) -> dict:
+    # Cached payloads are shared across records, so every caller gets its own top-level containers
+    # (and the per-day lists inside them) to edit.
+    copied = {}
+    for key, value in payload.items():
+        if isinstance(value, dict):
+            copied[key] = {inner_key: list(inner) if isinstance(inner, list) else inner for inner_key, inner in value.items()}
+        elif isinstance(value, list):
+            copied[key] = list(value)
+        else:
+            copied[key] = value
+    return copied
+
+
+def build_hours_payload(hours_raw: list[dict] | None, notes_structured: dict | None = None, *, now: datetime | None = None):
+    current_time = now or datetime.now()
+    signature = hashlib.blake2b(dump_json_bytes([hours_raw, notes_structured]), digest_size=16).digest()
+    cache_key = (signature, current_time.weekday(), current_time.hour, current_time.minute)
+    payload = _hours_payload_cache.get(cache_key)
+    if payload is None:
+        if len(_hours_payload_cache) >= HOURS_PAYLOAD_CACHE_MAX:
+            _hours_payload_cache.clear()
+        payload = _compute_hours_payload(hours_raw, notes_structured, current_time)
+        _hours_payload_cache[cache_key] = payload
+    return _copy_hours_payload(payload)
@@ -1,48 +1,153 @@
 from __future__ import annotations
 
 import json
+import mmap
 from pathlib import Path
 
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional streaming parser
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional fast encoder
+    orjson = None
+
 
 LIST_CONTAINER_KEYS = ("restaurants", "items", "results", "data")
+# GeoJSONL lines are Features without top-level lat/lng, so they are build outputs rather than record inputs.
+RECORD_FILE_PATTERNS = ("*.json", "*.ndjson")
+NDJSON_SUFFIXES = {".ndjson"}
+STREAMING_THRESHOLD_BYTES = 64 * 1024 * 1024
 
 
 def iter_record_files(root: Path):
-    return sorted(root.rglob("*.json"))
+    return sorted(path for pattern in RECORD_FILE_PATTERNS for path in root.rglob(pattern))
+
+
+def is_ndjson_path(path: Path):
+    return path.suffix.lower() in NDJSON_SUFFIXES
+
+
+def iter_ndjson_records(path: Path):
+    with path.open("r", encoding="utf-8") as handle:
+        for line in handle:
+            if line.strip():
+                yield json.loads(line)
+
+
+def dump_json_bytes(payload: object, *, indent: bool = False) -> bytes:
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+        return orjson.dumps(payload, option=option)
+
+    if indent:
+        return (json.dumps(payload, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def write_json_file(path: Path, payload: object, *, indent: bool = False):
+    path.write_bytes(dump_json_bytes(payload, indent=indent))
+
+
+def load_json_payload(path: Path) -> object:
+    with path.open("rb") as handle:
+        if path.stat().st_size == 0:
+            raise ValueError(f"Empty JSON file: {path}")
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if orjson is not None:
+                with memoryview(mapped) as view:
+                    return orjson.loads(view)
+            return json.loads(mapped[:])
+
+
+def container_key(payload: dict) -> str | None:
+    # The first container key holding a list, in document order; streamed reads apply the same rule.
+    return next((key for key, value in payload.items() if key in LIST_CONTAINER_KEYS and isinstance(value, list)), None)
 
 
 def load_record_container(path: Path) -> tuple[object, list[dict]]:
-    payload = json.loads(path.read_text(encoding="utf-8"))
+    if is_ndjson_path(path):
+        records = list(iter_ndjson_records(path))
+        return records, records
+
+    payload = load_json_payload(path)
     if isinstance(payload, list):
         return payload, payload
 
     if isinstance(payload, dict):
-        for key in LIST_CONTAINER_KEYS:
-            maybe_records = payload.get(key)
-            if isinstance(maybe_records, list):
-                return payload, maybe_records
+        key = container_key(payload)
+        if key is not None:
+            return payload, payload[key]
 
     raise ValueError(f"Unsupported JSON container shape in {path}")
 
 
-def read_json_records(path: Path) -> list[dict]:
-    _, records = load_record_container(path)
-    return records
+def _peek_root_token(handle) -> bytes:
+    while True:
+        chunk = handle.read(1)
+        if not chunk or not chunk.isspace():
+            handle.seek(0)
+            return chunk
+
+
+def _stream_container_key(handle) -> str | None:
+    # Mirrors container_key(): stop at the first top-level container array so ijson.items() is the only full pass.
+    pending_key = None
+    for prefix, event, value in ijson.parse(handle):
+        if prefix == "" and event == "map_key":
+            pending_key = value
+            continue
+        if pending_key in LIST_CONTAINER_KEYS and prefix == pending_key and event == "start_array":
+            return pending_key
+        pending_key = None
+    return None
+
+
+def iter_json_records(path: Path):
+    if is_ndjson_path(path):
+        yield from iter_ndjson_records(path)
+        return
+
+    if ijson is None or path.stat().st_size <= STREAMING_THRESHOLD_BYTES:
+        _, records = load_record_container(path)
+        yield from records
+        return
+
+    with path.open("rb") as handle:
+        root_token = _peek_root_token(handle)
+        if root_token == b"[":
+            yield from ijson.items(handle, "item", use_float=True)
+            return
+        if root_token == b"{":
+            key = _stream_container_key(handle)
+            if key is not None:
+                handle.seek(0)
+                yield from ijson.items(handle, f"{key}.item", use_float=True)
+                return
+
+    raise ValueError(f"Unsupported JSON container shape in {path}")
 
 
 def write_record_container(path: Path, original_payload: object, records: list[dict]):
+    if is_ndjson_path(path):
+        with path.open("w", encoding="utf-8") as handle:
+            for record in records:
+                handle.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+                handle.write("\n")
+        return
+
     if isinstance(original_payload, list):
         payload = records
     elif isinstance(original_payload, dict):
         payload = dict(original_payload)
-        written = False
-        for key in LIST_CONTAINER_KEYS:
-            if isinstance(payload.get(key), list):
-                payload[key] = records
-                written = True
-                break
-        if not written:
+        key = container_key(payload)
+        if key is None:
             raise ValueError(f"Unsupported JSON container shape in {path}")
+        payload[key] = records
     else:
         raise ValueError(f"Unsupported JSON container shape in {path}")
 
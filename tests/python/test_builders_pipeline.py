@@ -1,10 +1,20 @@
 from __future__ import annotations
 
+import json
+import shutil
 import unittest
+import uuid
+from datetime import datetime
+from pathlib import Path
+from zoneinfo import ZoneInfo
+from unittest import mock
 
+from scripts.pipeline import hours
 from scripts.pipeline.builders import (
+    build_app_data,
     build_audit_report,
     category_info,
+    collect_entries,
     derive_closure,
     google_core_missing,
     price_tier,
@@ -104,6 +114,63 @@ class BuildersPipelineTests(unittest.TestCase):
         self.assertEqual(price_tier("-"), 0)
         self.assertEqual(price_tier(None), 0)
 
+    def _make_temp_dir(self):
+        tmp_root = Path(".tmp") / "test-builders"
+        tmp_root.mkdir(parents=True, exist_ok=True)
+        temp_dir = tmp_root / uuid.uuid4().hex
+        temp_dir.mkdir()
+        self.addCleanup(lambda: shutil.rmtree(temp_dir, ignore_errors=True))
+        return temp_dir
+
+    def test_build_app_data_audit_reuses_hours_payloads_from_the_entry_pass(self):
+        temp_dir = self._make_temp_dir()
+        records = [
+            {
+                "url": "https://example.com/build-audit-cache",
+                "category_en": "Sushi",
+                "lat": 35.0,
+                "lng": 139.0,
+                "hours_raw": [{"title": "Wed", "dtl": "07:13-21:47"}],
+                "hours_notes_structured": {},
+            }
+        ]
+        (temp_dir / "records.json").write_text(json.dumps(records), encoding="utf-8")
+
+        with mock.patch.object(hours, "_compute_hours_payload", wraps=hours._compute_hours_payload) as compute:
+            build_app_data(input_root=temp_dir, output_root=temp_dir / "out")
+
+        self.assertEqual(compute.call_count, 1)
+
+    def test_worker_processes_match_the_serial_build_without_parent_recomputation(self):
+        temp_dir = self._make_temp_dir()
+        for index, category in enumerate(["Sushi", "Ramen", "Cafe"]):
+            records = [
+                {
+                    "url": f"https://example.com/{category.lower()}-{offset}",
+                    "name": f"{category} {offset}",
+                    "category_en": category,
+                    "lat": 35.0 + index / 10 if offset else None,
+                    "lng": 139.0 + offset / 10 if offset else None,
+                    "hours_raw": [{"title": "Mon-Fri", "dtl": f"1{offset}:00-22:00"}],
+                    "hours_notes_structured": {},
+                }
+                for offset in range(3)
+            ]
+            (temp_dir / f"{category.lower()}.json").write_text(json.dumps(records), encoding="utf-8")
+        now = datetime(2026, 3, 16, 12, 0, tzinfo=ZoneInfo("Asia/Tokyo"))
+
+        serial = collect_entries(input_root=temp_dir, workers=1, now=now)
+        parallel = collect_entries(input_root=temp_dir, workers=2, now=now)
+        self.assertEqual(parallel, serial)
+
+        with mock.patch.object(hours, "_compute_hours_payload", wraps=hours._compute_hours_payload) as compute:
+            _, _, audit = build_app_data(input_root=temp_dir, output_root=temp_dir / "out", workers=2)
+
+        self.assertEqual(compute.call_count, 0)
+        self.assertEqual(audit["rawRecordCount"], 9)
+        self.assertEqual(audit["appReadyRecordCount"], 6)
+        self.assertEqual(audit["missingCoordinatesByCategory"], {"Sushi": 1, "Ramen": 1, "Cafe": 1})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import gzip
+import json
+import shutil
+import struct
+import unittest
+import uuid
+from pathlib import Path
+
+from scripts.pipeline.geojson import build_geojson_artifacts, centroids_to_binary
+
+
+class GeojsonPipelineTests(unittest.TestCase):
+    def _make_input_root(self):
+        tmp_root = Path(".tmp") / "test-geojson"
+        tmp_root.mkdir(parents=True, exist_ok=True)
+        temp_dir = tmp_root / uuid.uuid4().hex
+        temp_dir.mkdir()
+        self.addCleanup(lambda: shutil.rmtree(temp_dir, ignore_errors=True))
+        input_root = temp_dir / "input"
+        input_root.mkdir()
+        records = [
+            {"url": "https://example.com/sushi-1", "category_en": "Sushi", "lat": 35.5, "lng": 139.5},
+            {"url": "https://example.com/sushi-2", "category_en": "Sushi", "lat": 35.75, "lng": 139.25},
+            {"url": "https://example.com/ramen-1", "category_en": "Ramen", "lat": 34.5, "lng": 135.5},
+            {"url": "https://example.com/missing", "category_en": "Ramen", "lat": None, "lng": None},
+        ]
+        (input_root / "records.json").write_text(json.dumps(records), encoding="utf-8")
+        return input_root, temp_dir / "out"
+
+    def _build(self, **kwargs):
+        input_root, output_root = self._make_input_root()
+        result = build_geojson_artifacts(input_root=input_root, output_root=output_root, workers=1, **kwargs)
+        manifest = json.loads((output_root / "manifest.json").read_text(encoding="utf-8"))
+        return output_root, result, {item["key"]: item for item in manifest["categories"]}
+
+    def _assert_manifest_matches(self, manifest, features_by_key):
+        self.assertEqual(set(manifest), {"sushi", "ramen"})
+        self.assertEqual(manifest["sushi"]["bbox"], [139.25, 35.5, 139.5, 35.75])
+        self.assertEqual(manifest["ramen"]["bbox"], [135.5, 34.5, 135.5, 34.5])
+        for key, item in manifest.items():
+            features = features_by_key[key]
+            self.assertEqual(len(features), item["count"])
+            self.assertTrue(all(feature["type"] == "Feature" for feature in features))
+
+    def test_feature_collections_parse_and_match_manifest(self):
+        output_root, result, manifest = self._build()
+
+        features_by_key = {}
+        for key, item in manifest.items():
+            self.assertEqual(item["url"], f"geojson/{key}_v2025.min.geojson")
+            payload = json.loads((output_root / f"{key}_v2025.min.geojson").read_text(encoding="utf-8"))
+            self.assertEqual(payload["type"], "FeatureCollection")
+            features_by_key[key] = payload["features"]
+
+        self._assert_manifest_matches(manifest, features_by_key)
+        self.assertEqual(result["featureCount"], 3)
+
+    def test_geojsonl_output_writes_one_feature_per_line(self):
+        output_root, _, manifest = self._build(ndjson=True)
+
+        features_by_key = {}
+        for key, item in manifest.items():
+            self.assertEqual(item["url"], f"geojson/{key}_v2025.geojsonl")
+            lines = (output_root / f"{key}_v2025.geojsonl").read_text(encoding="utf-8").splitlines()
+            features_by_key[key] = [json.loads(line) for line in lines]
+
+        self._assert_manifest_matches(manifest, features_by_key)
+
+    def test_gzip_output_is_referenced_by_manifest_and_decompresses_to_feature_collections(self):
+        output_root, result, manifest = self._build(compression="gzip")
+
+        features_by_key = {}
+        for key, item in manifest.items():
+            self.assertEqual(item["url"], f"geojson/{key}_v2025.min.geojson.gz")
+            payload = json.loads(gzip.decompress((output_root / f"{key}_v2025.min.geojson.gz").read_bytes()))
+            self.assertEqual(payload["type"], "FeatureCollection")
+            features_by_key[key] = payload["features"]
+
+        self._assert_manifest_matches(manifest, features_by_key)
+        centroids = json.loads(gzip.decompress(Path(result["centroidsPath"]).read_bytes()))
+        self.assertEqual(centroids["sushi"], [[139.5, 35.5], [139.25, 35.75]])
+
+    def test_binary_centroids_pack_little_endian_float32_pairs_with_point_offsets(self):
+        blob, index = centroids_to_binary(
+            {
+                "sushi": [[139.5, 35.25], [139.75, 35.5]],
+                "ramen": [[135.5, 34.75]],
+            }
+        )
+
+        self.assertEqual(index, {"sushi": {"offset": 0, "count": 2}, "ramen": {"offset": 2, "count": 1}})
+        self.assertEqual(struct.unpack("<6f", blob), (139.5, 35.25, 139.75, 35.5, 135.5, 34.75))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,7 +3,7 @@ from __future__ import annotations
 import unittest
 from datetime import datetime
 
-from scripts.pipeline.hours import build_hours_payload
+from scripts.pipeline.hours import build_hours_payload, parse_time_ranges
 
 
 class HoursPipelineTests(unittest.TestCase):
@@ -73,6 +73,44 @@ class HoursPipelineTests(unittest.TestCase):
         self.assertEqual(payload["openNowMeta"]["segment"]["end"], "02:00")
         self.assertTrue(payload["openNowMeta"]["crosses_midnight"])
 
+    def test_last_order_mark_before_a_range_does_not_swallow_the_range(self):
+        windows = parse_time_ranges("11:00-14:00 L.O 17:00-22:00")
+        self.assertEqual([(window["open"], window["close"]) for window in windows], [("11:00", "14:00"), ("17:00", "22:00")])
+        self.assertEqual(windows[0]["lastOrder"], "17:00")
+
+        windows = parse_time_ranges("L.O. 14:30-15:00")
+        self.assertEqual([(window["open"], window["close"]) for window in windows], [("14:30", "15:00")])
+        self.assertIsNone(windows[0]["lastOrder"])
+
+        windows = parse_time_ranges("Kilo 11:00-14:00")
+        self.assertEqual([(window["open"], window["close"]) for window in windows], [("11:00", "14:00")])
+
+    def test_identical_hours_input_reuses_payload_within_the_same_minute(self):
+        hours_raw = [{"title": "Mon", "dtl": "11:00-14:00"}]
+        first = build_hours_payload(hours_raw, {}, now=datetime(2026, 3, 16, 12, 0, 5))
+        second = build_hours_payload([dict(entry) for entry in hours_raw], {}, now=datetime(2026, 3, 16, 12, 0, 40))
+        later = build_hours_payload(hours_raw, {}, now=datetime(2026, 3, 16, 15, 0))
+
+        self.assertEqual(first, second)
+        self.assertEqual(first["openNowMeta"]["status"], "open")
+        self.assertEqual(later["openNowMeta"]["status"], "closed")
+
+    def test_cached_payloads_do_not_share_mutable_containers_between_callers(self):
+        hours_raw = [{"title": "Mon", "dtl": "11:00-14:00"}]
+        now = datetime(2026, 3, 16, 12, 0)
+        first = build_hours_payload(hours_raw, {}, now=now)
+        first["advisories"].append("edited")
+        first["weeklyTimeline"]["mon"].clear()
+        first["hoursDisplay"]["today"] = "edited"
+        first["openNowMeta"]["status"] = "edited"
+
+        second = build_hours_payload(hours_raw, {}, now=now)
+
+        self.assertNotIn("edited", second["advisories"])
+        self.assertEqual(len(second["weeklyTimeline"]["mon"]), 1)
+        self.assertNotEqual(second["hoursDisplay"]["today"], "edited")
+        self.assertEqual(second["openNowMeta"]["status"], "open")
+
 
 if __name__ == "__main__":
     unittest.main()
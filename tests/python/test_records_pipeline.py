@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import json
+import shutil
+import unittest
+import uuid
+from pathlib import Path
+from unittest import mock
+
+from scripts.pipeline import records as records_module
+from scripts.pipeline.records import iter_json_records, iter_record_files, load_record_container, write_record_container
+
+
+class RecordsPipelineTests(unittest.TestCase):
+    def _make_temp_root(self):
+        tmp_root = Path(".tmp") / "test-records"
+        tmp_root.mkdir(parents=True, exist_ok=True)
+        temp_dir = tmp_root / uuid.uuid4().hex
+        temp_dir.mkdir()
+        self.addCleanup(lambda: shutil.rmtree(temp_dir, ignore_errors=True))
+        return temp_dir
+
+    def _stream_all_files(self):
+        patcher = mock.patch.object(records_module, "STREAMING_THRESHOLD_BYTES", 0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_small_files_are_loaded_in_one_read(self):
+        root = self._make_temp_root()
+        path = root / "records.json"
+        path.write_text(json.dumps({"restaurants": [{"url": "a", "lat": 35.5}]}), encoding="utf-8")
+
+        self.assertEqual(list(iter_json_records(path)), [{"url": "a", "lat": 35.5}])
+
+    def test_empty_file_raises(self):
+        root = self._make_temp_root()
+        path = root / "records.json"
+        path.write_bytes(b"")
+
+        with self.assertRaises(ValueError):
+            list(iter_json_records(path))
+
+    def test_list_root_records_are_streamed_with_float_values(self):
+        self._stream_all_files()
+        root = self._make_temp_root()
+        path = root / "records.json"
+        path.write_text(json.dumps([{"url": "a", "lat": 35.5}, {"url": "b", "lat": 35.25}]), encoding="utf-8")
+
+        records = list(iter_json_records(path))
+
+        self.assertEqual([record["url"] for record in records], ["a", "b"])
+        self.assertIsInstance(records[0]["lat"], float)
+
+    def test_dict_root_streams_first_container_array_without_scanning_the_records(self):
+        self._stream_all_files()
+        root = self._make_temp_root()
+        path = root / "records.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "meta": {"items": "x"},
+                    "results": "not-a-list",
+                    "data": [{"url": f"https://example.com/{index}", "lat": 35.0} for index in range(500)],
+                }
+            ),
+            encoding="utf-8",
+        )
+        real_ijson = records_module.ijson
+        scanned_events = []
+
+        def counting_parse(handle):
+            for event in real_ijson.parse(handle):
+                scanned_events.append(event)
+                yield event
+
+        with mock.patch.object(records_module, "ijson", mock.Mock(wraps=real_ijson, parse=counting_parse)):
+            records = list(iter_json_records(path))
+
+        self.assertEqual(len(records), 500)
+        self.assertEqual(records[-1]["url"], "https://example.com/499")
+        self.assertLess(len(scanned_events), 20)
+
+    def test_loaded_streamed_and_written_paths_share_the_container_key_rule(self):
+        root = self._make_temp_root()
+        path = root / "records.json"
+        path.write_text(json.dumps({"data": [{"url": "A"}], "restaurants": [{"url": "B"}]}), encoding="utf-8")
+
+        original_payload, loaded = load_record_container(path)
+        loaded_from_iter = list(iter_json_records(path))
+        with mock.patch.object(records_module, "STREAMING_THRESHOLD_BYTES", 0):
+            streamed = list(iter_json_records(path))
+
+        self.assertEqual(loaded, [{"url": "A"}])
+        self.assertEqual(loaded_from_iter, loaded)
+        self.assertEqual(streamed, loaded)
+
+        write_record_container(path, original_payload, [{"url": "A2"}])
+        written = json.loads(path.read_text(encoding="utf-8"))
+        self.assertEqual(written, {"data": [{"url": "A2"}], "restaurants": [{"url": "B"}]})
+
+    def test_unsupported_container_shape_raises(self):
+        self._stream_all_files()
+        root = self._make_temp_root()
+        path = root / "records.json"
+        path.write_text(json.dumps({"restaurants": {"url": "a"}}), encoding="utf-8")
+
+        with self.assertRaises(ValueError):
+            list(iter_json_records(path))
+
+    def test_ndjson_records_are_discovered_read_and_written_line_by_line(self):
+        root = self._make_temp_root()
+        path = root / "records.ndjson"
+        path.write_text('{"url": "a"}\n\n{"url": "b"}\n', encoding="utf-8")
+        (root / "features.geojsonl").write_text('{"type": "Feature"}\n', encoding="utf-8")
+
+        self.assertEqual(iter_record_files(root), [path])
+        self.assertEqual([record["url"] for record in iter_json_records(path)], ["a", "b"])
+
+        original_payload, records = load_record_container(path)
+        records[0]["name"] = "updated"
+        write_record_container(path, original_payload, records)
+
+        self.assertEqual(path.read_text(encoding="utf-8").splitlines()[0], '{"url":"a","name":"updated"}')
+
+
+if __name__ == "__main__":
+    unittest.main()